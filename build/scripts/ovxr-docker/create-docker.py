@@ -1,4 +1,4 @@
-#!/usr/bin/env python3.8
+#!/usr/bin/env python3
 """
 create_single_docker.py
 
@@ -29,16 +29,23 @@ Example:
 """
 
 import argparse
+import atexit
+import functools
 import os
+import queue
 import re
 import sys
 import tempfile
 import tarfile
 import shutil
+import stat
 import subprocess
 import logging
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 # Check Python version requirement
 if sys.version_info < (3, 8):
@@ -50,48 +57,56 @@ if sys.version_info < (3, 8):
 # Supported and tested environments
 SUPPORTED_ENVIRONMENTS = ['CML', 'KNE', 'CLAB']
 
-# Global variable for current log file path
-_current_log_file = None
+# Buffer size used when streaming the (multi-GB) ISO and image tar files
+_TAR_BUFSIZE = 2 * 1024 * 1024
 
+# Read size used when draining the bake-and-build.sh output pipe
+_PIPE_CHUNK = 64 * 1024
 
-class DualOutputHandler(logging.Handler):
-    """Custom logging handler that writes to both console and log file"""
-    
-    def __init__(self):
-        super().__init__()
-        # Create console handler
-        self.console_handler = logging.StreamHandler()
-        self.console_handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        )
-    
-    def emit(self, record):
-        # Always emit to console
-        self.console_handler.emit(record)
-        
-        # Also emit to log file if available
-        global _current_log_file
-        if _current_log_file:
-            try:
-                # Format the message
-                msg = self.format(record)
-                with open(_current_log_file, 'a') as f:
-                    f.write(f"{msg}\n")
-            except Exception:
-                # Don't let logging errors break the main flow
-                pass
+# External tools, resolved once at import
+# System tar binary, preferred over the tarfile module for extraction when available
+_TAR = shutil.which('tar')
+# isoinfo reads sim_cfg.yml out of the ISO; dpkg is the SDK version fallback
+_ISOINFO = shutil.which('isoinfo')
+_DPKG = shutil.which('dpkg')
+# rm -rf removes large extracted trees much faster than shutil.rmtree
+_RM = shutil.which('rm')
+
+# Log record format shared by the console and the per-run log file
+_LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
 
-# Set up logging with custom handler
+# Separator line around the workflow start and completion messages
+_BANNER = "=" * 80
+
+# Set up logging. Callers only enqueue records; a listener thread does the
+# console writes. The per-run log file handler is attached by CreateSingleDocker.
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
-logger.addHandler(DualOutputHandler())
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _console_handler, respect_handler_level=True)
+_log_listener.start()
+# Drain queued records before logging.shutdown() closes the handler
+atexit.register(_log_listener.stop)
 
-# Set formatter for the dual handler
-for handler in logger.handlers:
-    if isinstance(handler, DualOutputHandler):
-        handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        )
+# Logger for records that go to the run log file only, not the console
+_file_logger = logger.getChild("file")
+_file_logger.propagate = False
+
+class RunLogFileHandler(logging.FileHandler):
+    """
+    File handler for the per-run log. Records are left in the file's write buffer
+    instead of being flushed one at a time; ERROR records and close() flush it.
+    """
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
 
 # ==============================================================================
 # PLATFORM MAPPINGS
@@ -100,7 +115,8 @@ for handler in logger.handlers:
 # Update these when new platforms are released or platform definitions change.
 
 # Platform mapping based on tar filename patterns and extracted qcow2 filenames
-PLATFORM_MAPPING = {
+# (read-only views; edit the literals below to add platforms)
+PLATFORM_MAPPING = MappingProxyType({
     # Standard platforms (from tar filename pattern)
     '8000': '8000',
     '8101': '8101-32H',      # Default 8101 variant
@@ -126,10 +142,10 @@ PLATFORM_MAPPING = {
     
     # Special cases
     'ncs1010': 'ncs1010',
-}
+})
 
 # Mapping from qcow2 filename patterns to platform types
-QCOW2_TO_PLATFORM = {
+QCOW2_TO_PLATFORM = MappingProxyType({
     '8000-x64': '8201-sys',      # 8000 qcow2 is used for 8201 system variants
     '8101-x64': '8101-32H',      # Standard 8101
     '8101-32FH-x64': '8101-32FH',
@@ -140,15 +156,189 @@ QCOW2_TO_PLATFORM = {
     '8202-32FH-M-x64': '8202-32FH-M',
     '8212-48FH-M-x64': '8212-48FH-M',
     '8711-32FH-M-x64': '8711-32FH-M',
-}
+})
+
+# Single-probe lookup for qcow2 base names: every QCOW2_TO_PLATFORM key plus its
+# form without '-x64', exact keys taking precedence over the stripped forms
+_QCOW2_INDEX = MappingProxyType({
+    **{pattern.replace('-x64', ''): platform for pattern, platform in QCOW2_TO_PLATFORM.items()},
+    **QCOW2_TO_PLATFORM,
+})
+
+# Pre-compiled patterns for qcow2 filename platform detection
+# Version suffix like -x64-25.1.2 or -25.1.2
+_QCOW2_VERSION_RE = re.compile(r'-x64-\d+\.\d+\.\d+$|-\d+\.\d+\.\d+$')
+# Leading 4-digit platform number, e.g. 8101 in 8101-32FH
+_PLATFORM_NUMBER_RE = re.compile(r'^(\d{4})')
+
+# bake-and-build.sh line announcing where the Docker image tar is saved.
+# Searched over the whole output, so the separator before the path must not cross lines.
+_DOCKER_IMG_RE = re.compile(r'Saving docker image,.*?to[^\S\n]+(.+\.tar)', re.IGNORECASE)
+
+# Image tar filename pattern, capturing the base (8000-<version>) and EFT version
+# used to derive the matching ISO tar name. Covers fixed (-f-...-image-) and
+# distributed (-d-...-images-) platforms: 8000-<version>-<type>-<platform>-image[s]-<eft>.tar
+_IMAGE_TAR_RE = re.compile(r'^(8000-\d+)-[fd]-\d+(?:-[\w-]+)?-images?-(eft[\d\.]+)\.tar$')
+
+# Drop folders reported by bake-and-build.sh ("NAME: /path") that are removed after a run
+_DROP_FOLDERS = ('IMG_DROP_FOLDER', 'YAML_DROP_FOLDER')
+_DROP_FOLDER_PREFIXES = tuple(f"{name}:" for name in _DROP_FOLDERS)
+
+@functools.lru_cache(maxsize=4096)
+def _platform_from_qcow2_filename(qcow2_filename):
+    """
+    Map a qcow2 filename to its platform, e.g. 8101-32FH-x64-25.1.2.qcow2 -> 8101-32FH.
+    Pure function of the filename, so results are cached (bounded by maxsize).
+    """
+    try:
+        # Remove .qcow2 extension and version number
+        base_name = qcow2_filename.replace('.qcow2', '')
+        
+        # Remove version pattern like -x64-25.1.2 or -25.1.2
+        base_name = _QCOW2_VERSION_RE.sub('', base_name)
+        
+        logger.debug("Processing qcow2 base name: %s", base_name)
+        
+        # Look for exact or '-x64'-less matches in our qcow2 to platform mapping
+        platform = _QCOW2_INDEX.get(base_name)
+        if platform:
+            logger.debug("qcow2 mapping match found: %s -> %s", base_name, platform)
+            return platform
+                
+        # Fallback: extract base platform number and look it up
+        platform_match = _PLATFORM_NUMBER_RE.match(base_name)
+        if platform_match:
+            base_platform = platform_match.group(1)
+            mapped_platform = PLATFORM_MAPPING.get(base_platform, base_platform)
+            logger.debug("Fallback platform mapping: %s -> %s", base_platform, mapped_platform)
+            return mapped_platform
+            
+        return None
+        
+    except Exception as e:
+        logger.warning("Could not extract platform from qcow2 filename %s: %s", qcow2_filename, e)
+        return None
+
+@functools.lru_cache(maxsize=1024)
+def _platform_from_tar_filename(filename):
+    """
+    Map an image tar filename to its platform, e.g. 8000-2512-f-8101-image-eft15.1.tar -> 8101-32H.
+    Pure function of the filename, so results are cached (bounded by maxsize).
+    """
+    try:
+        # First, try to extract from tar filename pattern
+        parts = filename.split('-')
+        
+        # Single scan for the first 'd' and 'f' markers and the first 4-digit platform number
+        d_index = f_index = platform_number = None
+        for i, part in enumerate(parts):
+            if part == 'd':
+                if d_index is None:
+                    d_index = i
+            elif part == 'f':
+                if f_index is None:
+                    f_index = i
+            elif platform_number is None and len(part) == 4 and part[0] == '8' and part.isdigit():
+                platform_number = part
+        
+        # Handle distributed platform patterns (8000-2512-d-8804-images-eft15.1.tar)
+        if d_index is not None and d_index + 1 < len(parts):
+            platform_part = parts[d_index + 1]
+            if platform_part in PLATFORM_MAPPING:
+                return PLATFORM_MAPPING[platform_part]
+        
+        # Handle fixed platform patterns (8000-2512-f-8101-image-eft15.1.tar)
+        if f_index is not None and f_index + 1 < len(parts):
+            platform_part = parts[f_index + 1]
+            
+            # Handle complex platform names like "8202" or "8711"
+            if platform_part in PLATFORM_MAPPING:
+                return PLATFORM_MAPPING[platform_part]
+            
+            # Handle cases where the platform part has additional suffixes
+            base_platform = platform_part.split('-')[0] if '-' in platform_part else platform_part
+            if base_platform in PLATFORM_MAPPING:
+                return PLATFORM_MAPPING[base_platform]
+        
+        # Handle special cases like ncs1010
+        if 'ncs1010' in filename:
+            return 'ncs1010'
+        
+        # Fallback: first 4-digit platform number
+        if platform_number:
+            return PLATFORM_MAPPING.get(platform_number, platform_number)
+                
+        raise ValueError("Could not extract platform from filename")
+        
+    except Exception as e:
+        logger.warning("Could not extract platform from filename %s: %s", filename, e)
+        return "8201-32FH"  # Default platform
+
+def _pick_tmpdir(need_bytes):
+    """
+    Return /dev/shm when it has at least twice need_bytes free, so extracted files
+    are served from RAM, otherwise None (tempfile's default location).
+    The headroom is a rough allowance: bake-and-build.sh also writes its baked
+    images into this directory, and tmpfs pages compete with the VM it boots.
+    """
+    shm = Path('/dev/shm')
+    if shm.is_dir():
+        st = os.statvfs(shm)
+        if st.f_bavail * st.f_frsize > need_bytes * 2:
+            return str(shm)
+    return None
+
+def _remove_tree(path):
+    """Remove a directory tree with rm -rf, or shutil.rmtree when rm is unavailable"""
+    # Like shutil.rmtree, refuse a symlink: rm -rf would only unlink it and leave the contents
+    if os.path.islink(path):
+        raise OSError(f"Cannot remove a symbolic link as a directory tree: {path}")
+    if not _RM:
+        shutil.rmtree(path)
+        return
+    result = subprocess.run([_RM, '-rf', '--', str(path)], stderr=subprocess.PIPE, text=True)
+    if result.returncode != 0:
+        raise OSError(f"rm -rf {path} failed: {result.stderr.strip()}")
+
+def _iter_files_with_suffix(root, suffix):
+    """
+    Lazily yield files under root whose name ends with suffix (case-insensitive),
+    so callers that only need the first match stop walking as soon as it is found.
+    """
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            if name.lower().endswith(suffix):
+                yield Path(dirpath) / name
+
+@functools.lru_cache(maxsize=32)
+def _read_sim_cfg(iso_path, mtime, size):
+    """
+    Read /sim_cfg.yml out of an ISO with isoinfo.
+    Cached on (iso_path, mtime, size) so repeated lookups on the same ISO don't
+    respawn isoinfo; a changed mtime or size invalidates the entry.
+    """
+    return subprocess.run(
+        [_ISOINFO, '-R', '-x', '/sim_cfg.yml', '-i', iso_path],
+        capture_output=True,
+        text=True,
+        timeout=30
+    )
 
 class CreateSingleDockerError(Exception):
     """Custom exception for create_single_docker operations"""
     pass
 
 class CreateSingleDocker:
+    # Fixed attribute set: no per-instance __dict__. Platform mappings are module-level.
+    __slots__ = (
+        'iso_tar_path', 'image_tar_path', 'platform', 'docker_name', 'target', 'cleanup',
+        'temp_dir_path', 'run_tag', 'temp_dir', 'iso_path', 'sdk_version', 'script_dir',
+        'bake_and_build_script', 'initial_file_conf', 'log_dir', 'log_file',
+        'bake_build_log_file', '_file_handler', 'input_bytes', 'use_shm',
+    )
+    
     def __init__(self, iso_tar_path, image_tar_path, platform=None, docker_name=None, 
-                 target="all", cleanup=True, temp_dir=None):
+                 target="all", cleanup=True, temp_dir=None, run_tag=None, use_shm=False):
         """
         Initialize the CreateSingleDocker instance.
         
@@ -160,6 +350,8 @@ class CreateSingleDocker:
             target (str): Target type for bake-and-build.sh (default: 'all')
             cleanup (bool): Whether to cleanup temporary files (default: True)
             temp_dir (str): Custom temporary directory path (optional)
+            run_tag (str): Tag for the logging directory name (default: instance creation time)
+            use_shm (bool): Extract into /dev/shm when it has room; ignored without cleanup (default: False)
         """
         self.iso_tar_path = Path(iso_tar_path).resolve()
         self.image_tar_path = Path(image_tar_path).resolve()
@@ -168,6 +360,8 @@ class CreateSingleDocker:
         self.target = target
         self.cleanup = cleanup
         self.temp_dir_path = temp_dir
+        self.use_shm = use_shm
+        self.run_tag = run_tag or datetime.now().strftime("%Y%m%d_%H%M%S")
         self.temp_dir = None
         self.iso_path = None
         self.sdk_version = None
@@ -179,10 +373,10 @@ class CreateSingleDocker:
         self.log_dir = None
         self.log_file = None
         self.bake_build_log_file = None
+        self._file_handler = None
         
-        # Reference module-level platform mappings
-        self.platform_mapping = PLATFORM_MAPPING
-        self.qcow2_to_platform = QCOW2_TO_PLATFORM
+        # Combined size of the ISO and image tars, set by _validate_inputs
+        self.input_bytes = 0
         
         # Validate inputs
         self._validate_inputs()
@@ -204,26 +398,48 @@ class CreateSingleDocker:
         with open(conf_path, 'r') as f:
             files = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
 
-        missing = []
-        for rel_path in files:
-            abs_path = _root_ / rel_path
-            if not abs_path.exists():
-                missing.append(str(abs_path))
+        abs_paths = [_root_ / rel_path for rel_path in files]
+        if len(abs_paths) < 8:
+            # Few entries: a stat per file is cheaper than listing directories
+            missing = [str(abs_path) for abs_path in abs_paths if not abs_path.exists()]
+        else:
+            # List each parent directory once and check membership, instead of
+            # one stat per file
+            present = set()
+            for parent in {abs_path.parent for abs_path in abs_paths}:
+                try:
+                    with os.scandir(parent) as entries:
+                        # Symlinks count only if their target exists, as with Path.exists()
+                        present.update(
+                            os.path.join(parent, entry.name) for entry in entries
+                            if not entry.is_symlink() or os.path.exists(entry.path)
+                        )
+                except OSError:
+                    # Missing parent directory, all of its files are reported missing
+                    pass
+            missing = [str(abs_path) for abs_path in abs_paths if str(abs_path) not in present]
 
         if missing:
             raise CreateSingleDockerError(
                 f"Missing required files: {missing}\n"
                 "If you are unsure, re-download the latest 8000-emulator-eft*.tar and untar to restore missing files."
             )
-        logger.info(f"All required files present as per {conf_path}")
+        logger.info("All required files present as per %s", conf_path)
             
     def _validate_inputs(self):
         """Validate input files and parameters"""
-        if not self.iso_tar_path.exists():
+        # One stat per tar: it is the existence check and gives the size for temp dir placement
+        try:
+            iso_tar_size = os.stat(self.iso_tar_path).st_size
+        except OSError:
             raise CreateSingleDockerError(f"ISO tar file not found: {self.iso_tar_path}")
             
-        if not self.image_tar_path.exists():
+        try:
+            image_tar_size = os.stat(self.image_tar_path).st_size
+        except OSError:
             raise CreateSingleDockerError(f"Image tar file not found: {self.image_tar_path}")
+        
+        self.input_bytes = iso_tar_size + image_tar_size
             
         if not self.bake_and_build_script.exists():
             raise CreateSingleDockerError(f"bake-and-build.sh not found: {self.bake_and_build_script}")
@@ -232,130 +448,106 @@ class CreateSingleDocker:
         if not self.platform:
             self.platform = self._extract_platform_from_filename(self.image_tar_path.name)
             
-        logger.info(f"Using platform: {self.platform}")
+        logger.info("Using platform: %s", self.platform)
         
     def _extract_platform_from_qcow2_filename(self, qcow2_filename):
         """
         Extract platform from qcow2 filename.
         Example: 8101-32FH-x64-25.1.2.qcow2 -> 8101-32FH
         """
-        try:
-            # Remove .qcow2 extension and version number
-            base_name = qcow2_filename.replace('.qcow2', '')
-            
-            # Split by version pattern (remove version like 25.1.2)
-            import re
-            # Remove version pattern like -x64-25.1.2 or -25.1.2
-            version_pattern = r'-x64-\d+\.\d+\.\d+$|-\d+\.\d+\.\d+$'
-            base_name = re.sub(version_pattern, '', base_name)
-            
-            logger.debug(f"Processing qcow2 base name: {base_name}")
-            
-            # Look for exact matches in our qcow2 to platform mapping
-            for qcow2_pattern, platform in self.qcow2_to_platform.items():
-                if base_name == qcow2_pattern:
-                    logger.debug(f"Exact match found: {base_name} -> {platform}")
-                    return platform
-            
-            # Try partial matches for complex platform names
-            for qcow2_pattern, platform in self.qcow2_to_platform.items():
-                pattern_base = qcow2_pattern.replace('-x64', '')
-                if base_name == pattern_base:
-                    logger.debug(f"Pattern match found: {base_name} -> {platform}")
-                    return platform
-                    
-            # Fallback: extract base platform number and look it up
-            platform_match = re.match(r'^(\d{4})', base_name)
-            if platform_match:
-                base_platform = platform_match.group(1)
-                mapped_platform = self.platform_mapping.get(base_platform, base_platform)
-                logger.debug(f"Fallback platform mapping: {base_platform} -> {mapped_platform}")
-                return mapped_platform
-                
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Could not extract platform from qcow2 filename {qcow2_filename}: {e}")
-            return None
+        # Memoized on the bare filename so different extraction dirs share cache entries
+        return _platform_from_qcow2_filename(os.path.basename(qcow2_filename))
         
     def _extract_platform_from_filename(self, filename):
         """
         Extract platform identifier from tar filename with enhanced mapping.
         Example: 8000-2512-f-8101-image-eft15.1.tar -> 8101-32H
         """
-        try:
-            # First, try to extract from tar filename pattern
-            parts = filename.split('-')
-            
-            # Handle distributed platform patterns (8000-2512-d-8804-images-eft15.1.tar)
-            if 'd' in parts:
-                d_index = parts.index('d')
-                if d_index + 1 < len(parts):
-                    platform_part = parts[d_index + 1]
-                    if platform_part in self.platform_mapping:
-                        return self.platform_mapping[platform_part]
-            
-            # Handle fixed platform patterns (8000-2512-f-8101-image-eft15.1.tar)
-            if 'f' in parts:
-                f_index = parts.index('f')
-                if f_index + 1 < len(parts):
-                    platform_part = parts[f_index + 1]
-                    
-                    # Handle complex platform names like "8202" or "8711"
-                    if platform_part in self.platform_mapping:
-                        return self.platform_mapping[platform_part]
-                    
-                    # Handle cases where the platform part has additional suffixes
-                    base_platform = platform_part.split('-')[0] if '-' in platform_part else platform_part
-                    if base_platform in self.platform_mapping:
-                        return self.platform_mapping[base_platform]
-            
-            # Handle special cases like ncs1010
-            if 'ncs1010' in filename:
-                return 'ncs1010'
-            
-            # Fallback: look for 4-digit platform numbers
-            for part in parts:
-                if part.isdigit() and len(part) == 4 and part.startswith('8'):
-                    return self.platform_mapping.get(part, part)
-                    
-            raise ValueError("Could not extract platform from filename")
-            
-        except Exception as e:
-            logger.warning(f"Could not extract platform from filename {filename}: {e}")
-            return "8201-32FH"  # Default platform
+        return _platform_from_tar_filename(filename)
             
     def _create_temp_directory(self):
         """Create temporary directory for extraction"""
         if self.temp_dir_path:
             self.temp_dir = Path(self.temp_dir_path)
             self.temp_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Using custom temp directory: {self.temp_dir}")
+            logger.info("Using custom temp directory: %s", self.temp_dir)
         else:
-            self.temp_dir = Path(tempfile.mkdtemp(prefix="create_single_docker_"))
+            # Use tmpfs only on request, and never when the tree would be left behind
+            # in RAM by --no-cleanup
+            tmp_parent = None
+            if self.use_shm:
+                if self.cleanup:
+                    tmp_parent = _pick_tmpdir(self.input_bytes)
+                else:
+                    logger.warning("Ignoring --use-shm because cleanup is disabled")
+            self.temp_dir = Path(tempfile.mkdtemp(prefix="create_single_docker_", dir=tmp_parent))
             self.temp_dir.chmod(0o755)
-            logger.info(f"Created temp directory to extract files: {self.temp_dir}")
+            logger.info("Created temp directory to extract files: %s", self.temp_dir)
+            
+    def _extract_tar_file(self, tar_path, extract_to, find_suffix=None):
+        """
+        Extract tar file to specified directory.
+        
+        Args:
+            tar_path (Path): The tar file to extract
+            extract_to (Path): Directory to extract into
+            find_suffix (str): Optional member suffix to look for, e.g. '.qcow2' (case-insensitive)
             
-    def _extract_tar_file(self, tar_path, extract_to):
-        """Extract tar file to specified directory"""
-        logger.debug(f"Extracting {tar_path.name} to {extract_to}")
+        Returns:
+            Path or None: The first extracted member ending with find_suffix, if requested and found
+        """
+        logger.debug("Extracting %s to %s", tar_path.name, extract_to)
         try:
-            with tarfile.open(tar_path, 'r') as tar:
-                tar.extractall(path=extract_to)
-                logger.info(f"Extracted {tar_path.name} to {extract_to}")
-                # Return list of extracted files
-                return [extract_to / member.name for member in tar.getmembers()]
+            if _TAR:
+                # Native tar is several times faster than tarfile on multi-GB archives and
+                # detects compression itself; -v lists each extracted member on stdout
+                result = subprocess.run(
+                    [_TAR, '--no-same-owner', '--quoting-style=literal', '-xvf', str(tar_path), '-C', str(extract_to)],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    check=True
+                )
+                # Member names are raw bytes and need not be valid UTF-8; decode them like
+                # file system paths and split only on '\n', which cannot occur in a listed name
+                member_names = [os.fsdecode(name) for name in result.stdout.split(b'\n') if name]
+            else:
+                # Fallback for hosts without a tar binary
+                # Stream the archive sequentially (no seeking), with transparent decompression
+                member_names = []
+                
+                def _members(tar):
+                    # Record each member's name as extractall reads it from the stream
+                    for member in tar:
+                        member_names.append(member.name)
+                        yield member
+                
+                with tarfile.open(tar_path, 'r|*', bufsize=_TAR_BUFSIZE, copybufsize=_TAR_BUFSIZE) as tar:
+                    # extractall reads the stream in a single pass and applies directory
+                    # modes and mtimes once all members are written
+                    tar.extractall(path=extract_to, members=_members(tar))
+            
+            logger.info("Extracted %s to %s", tar_path.name, extract_to)
+            
+            if find_suffix:
+                # Only this archive's own members are considered, stopping at the first hit
+                for name in member_names:
+                    if name.lower().endswith(find_suffix):
+                        return extract_to / name
+            return None
+        except subprocess.CalledProcessError as e:
+            raise CreateSingleDockerError(f"Failed to extract {tar_path}: {e.stderr.decode(errors='replace').strip()}")
         except Exception as e:
             raise CreateSingleDockerError(f"Failed to extract {tar_path}: {e}")
             
-    def _find_iso_file(self, extracted_files):
-        """Find the ISO file among extracted files"""
-        iso_files = [f for f in extracted_files if f.suffix.lower() == '.iso']
-        if not iso_files:
+    def _find_iso_file(self, extract_dir):
+        """Find the ISO file in the directory the ISO tar was extracted to"""
+        iso_files = _iter_files_with_suffix(extract_dir, '.iso')
+        iso_file = next(iso_files, None)
+        if iso_file is None:
             raise CreateSingleDockerError("No ISO file found in extracted files")
-        if len(iso_files) > 1:
-            logger.warning(f"Multiple ISO files found, using first: {iso_files[0]}")
-        return iso_files[0]
+        if next(iso_files, None) is not None:
+            logger.warning("Multiple ISO files found, using first: %s", iso_file)
+        return iso_file
         
     def _extract_sdk_version_from_iso(self, iso_path):
         """
@@ -367,27 +559,23 @@ class CreateSingleDocker:
         then checks installed dpkg packages as a fallback.
         """
         try:
-            if not shutil.which('isoinfo'):
+            if not _ISOINFO:
                 logger.warning("isoinfo command not found, cannot extract SDK version")
                 return None
                 
-            logger.debug(f"Extracting SDK version from ISO: {iso_path}")
+            logger.debug("Extracting SDK version from ISO: %s", iso_path)
             
-            result = subprocess.run(
-                ['isoinfo', '-R', '-x', '/sim_cfg.yml', '-i', str(iso_path)],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            iso_stat = os.stat(iso_path)
+            result = _read_sim_cfg(str(iso_path), iso_stat.st_mtime, iso_stat.st_size)
             
             if result.returncode != 0:
-                logger.warning(f"isoinfo command failed with return code {result.returncode}")
-                logger.warning(f"isoinfo stderr: {result.stderr}")
+                logger.warning("isoinfo command failed with return code %s", result.returncode)
+                logger.warning("isoinfo stderr: %s", result.stderr)
                 return self._extract_sdk_version_from_dpkg()
             
             sim_cfg = result.stdout
             if sim_cfg.strip():
-                logger.info(f"sim_cfg.yml contents:\n{sim_cfg.strip()}")
+                logger.info("sim_cfg.yml contents:\n%s", sim_cfg.strip())
             
             sdk_fields = ["sdk:", "sdk_ver_pacific:", "sdk_version:", "sdkdc:"]
             for line in sim_cfg.split('\n'):
@@ -396,7 +584,7 @@ class CreateSingleDocker:
                     if line.startswith(field):
                         sdk_version = line.split(':', 1)[1].strip()
                         if sdk_version:
-                            logger.info(f"Extracted SDK version '{sdk_version}' from field '{field}'")
+                            logger.info("Extracted SDK version '%s' from field '%s'", sdk_version, field)
                             return sdk_version
             
             # Generic fallback: any line containing 'sdk' (case-insensitive)
@@ -404,7 +592,7 @@ class CreateSingleDocker:
                 if 'sdk' in line.lower() and ':' in line:
                     sdk_version = line.split(':', 1)[1].strip()
                     if sdk_version:
-                        logger.info(f"Extracted SDK version '{sdk_version}' from line: {line.strip()}")
+                        logger.info("Extracted SDK version '%s' from line: %s", sdk_version, line.strip())
                         return sdk_version
                     
             logger.warning("SDK version not found in sim_cfg.yml, trying dpkg fallback")
@@ -414,7 +602,7 @@ class CreateSingleDocker:
             logger.warning("isoinfo command timed out")
             return self._extract_sdk_version_from_dpkg()
         except Exception as e:
-            logger.warning(f"Failed to extract SDK version from ISO: {e}")
+            logger.warning("Failed to extract SDK version from ISO: %s", e)
             return self._extract_sdk_version_from_dpkg()
     
     def _extract_sdk_version_from_dpkg(self):
@@ -423,9 +611,12 @@ class CreateSingleDocker:
         Looks for packages matching 'vxr2-ngdp-sdk' pattern.
         Returns the SDK identifier (e.g. 'sdkdc-24.10.2230.6') or None.
         """
+        if not _DPKG:
+            logger.warning("dpkg command not found, cannot extract SDK version from installed packages")
+            return None
         try:
             result = subprocess.run(
-                ['dpkg', '-l'],
+                [_DPKG, '-l'],
                 capture_output=True, text=True, timeout=15
             )
             for line in result.stdout.split('\n'):
@@ -436,35 +627,32 @@ class CreateSingleDocker:
                         # Package name format: vxr2-ngdp-sdkdc-24.10.2230.6
                         # Extract the SDK identifier after 'vxr2-ngdp-'
                         sdk_id = pkg_name.replace('vxr2-ngdp-', '', 1)
-                        logger.info(f"Extracted SDK version from dpkg: {sdk_id}")
+                        logger.info("Extracted SDK version from dpkg: %s", sdk_id)
                         return sdk_id
             logger.warning("No vxr2-ngdp-sdk package found via dpkg")
             return None
         except Exception as e:
-            logger.warning(f"dpkg fallback failed: {e}")
+            logger.warning("dpkg fallback failed: %s", e)
             return None
         
-    def _refine_platform_from_extracted_files(self, extracted_files):
+    def _refine_platform_from_extracted_files(self, qcow2_file):
         """
-        Refine platform detection using extracted qcow2 files.
+        Refine platform detection using the first qcow2 file extracted from the image tar.
         This provides more accurate platform identification.
         """
         try:
-            # Find qcow2 files in extracted files
-            qcow2_files = [f for f in extracted_files if f.suffix.lower() == '.qcow2']
-            
-            if qcow2_files:
+            if qcow2_file:
                 # Use the first qcow2 file to refine platform detection
-                qcow2_filename = qcow2_files[0].name
-                logger.info(f"Found qcow2 file for platform refinement: {qcow2_filename}")
+                qcow2_filename = qcow2_file.name
+                logger.info("Found qcow2 file for platform refinement: %s", qcow2_filename)
                 
                 refined_platform = self._extract_platform_from_qcow2_filename(qcow2_filename)
                 if refined_platform:
-                    logger.info(f"Refined platform from qcow2 filename: {self.platform} -> {refined_platform}")
+                    logger.info("Refined platform from qcow2 filename: %s -> %s", self.platform, refined_platform)
                     self.platform = refined_platform
                     
         except Exception as e:
-            logger.warning(f"Could not refine platform from extracted files: {e}")
+            logger.warning("Could not refine platform from extracted files: %s", e)
             # Continue with original platform detection
         
     def _build_bake_and_build_command(self):
@@ -484,17 +672,21 @@ class CreateSingleDocker:
         # Add SDK version if available
         if self.sdk_version:
             cmd.extend(["--forcesdk", self.sdk_version])
-            logger.debug(f"Adding SDK version parameter to use with bake-and-build: --forcesdk {self.sdk_version}")
+            logger.debug("Adding SDK version parameter to use with bake-and-build: --forcesdk %s", self.sdk_version)
             
         return cmd
         
-    def _run_bake_and_build(self, cmd):
+    def _run_bake_and_build(self, cmd, cmd_str):
         """
         Execute bake-and-build.sh command and capture output
         Streams output to log file in real-time for live following with tail -f
         
+        Args:
+            cmd (list): The bake-and-build.sh command
+            cmd_str (str): The command joined into a single string, for logging
+            
         Returns:
-            tuple: (return_code, output) - return code and captured output
+            tuple: (return_code, output) - return code and captured output text
         """
         # Initialize log file with header
         if self.bake_build_log_file:
@@ -502,47 +694,75 @@ class CreateSingleDocker:
                 with open(self.bake_build_log_file, 'w') as f:
                     f.write(f"=== bake-and-build.sh Output ===\n")
                     f.write(f"Timestamp: {datetime.now().isoformat()}\n")
-                    f.write(f"Command: {' '.join(cmd)}\n")
+                    f.write(f"Command: {cmd_str}\n")
                     f.write(f"\n=== Live Output ===\n")
                     f.flush()
             except Exception as e:
-                logger.warning(f"Failed to initialize bake-and-build.sh log file: {e}")
+                logger.warning("Failed to initialize bake-and-build.sh log file: %s", e)
         
         try:
-            # Start subprocess with real-time output capture
+            # Start subprocess with raw binary output capture; decoding is done
+            # per line below instead of through a line-buffered TextIOWrapper
             process = subprocess.Popen(
                 cmd,
+                cwd=self.bake_and_build_script.parent,  # Run from the script directory
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Combine stderr with stdout
-                text=True,
-                bufsize=1,  # Line buffered
-                universal_newlines=True
+                bufsize=0
             )
             
-            all_output = []
+            # Raw output, kept as bytes until the process exits
+            output = bytearray()
             
-            # Read output line by line and write to log file immediately
-            while True:
-                output = process.stdout.readline()
-                if output == '' and process.poll() is not None:
-                    break
-                if output:
-                    line = output.rstrip()  # Remove trailing newline for consistent formatting
-                    all_output.append(line)
+            # Keep the log file open for the whole run. os.write() on the raw fd is
+            # unbuffered, so each chunk is visible to tail -f as soon as it is written.
+            log_fd = None
+            if self.bake_build_log_file:
+                try:
+                    log_fd = os.open(self.bake_build_log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                except OSError as e:
+                    logger.warning("Failed to open bake-and-build.sh log: %s", e)
+            
+            # Drain the pipe in large chunks, write each chunk to the log file as-is
+            # and append it to the captured output
+            out_fd = process.stdout.fileno()
+            try:
+                while True:
+                    chunk = os.read(out_fd, _PIPE_CHUNK)
+                    if not chunk:
+                        break
                     
                     # Write to log file immediately for real-time following
-                    if self.bake_build_log_file:
+                    if log_fd is not None:
                         try:
-                            with open(self.bake_build_log_file, 'a') as f:
-                                f.write(f"{line}\n")
-                                f.flush()  # Ensure immediate write to disk
+                            os.write(log_fd, chunk)
                         except Exception as e:
                             # Don't break execution if logging fails
-                            logger.warning(f"Failed to write to bake-and-build.sh log: {e}")
+                            logger.warning("Failed to write to bake-and-build.sh log: %s", e)
+                    
+                    output += chunk
+                
+                # Terminate a trailing partial line in the log file
+                if log_fd is not None and output and not output.endswith(b'\n'):
+                    try:
+                        os.write(log_fd, b'\n')
+                    except Exception as e:
+                        logger.warning("Failed to write to bake-and-build.sh log: %s", e)
+            finally:
+                process.stdout.close()
+                if log_fd is not None:
+                    os.close(log_fd)
             
             # Wait for process to complete
             return_code = process.wait()
             
+            # Decode and split the captured output once, now that it is complete.
+            # Translate \r\n and bare \r (progress output) to \n like text-mode pipes did.
+            text = output.decode(errors='replace').replace('\r\n', '\n').replace('\r', '\n')
+            all_output = [line.rstrip() for line in text.split('\n')]
+            if not text or text.endswith('\n'):
+                all_output.pop()
+            
             # Finalize log file
             if self.bake_build_log_file:
                 try:
@@ -552,36 +772,30 @@ class CreateSingleDocker:
                         f.write(f"Completed at: {datetime.now().isoformat()}\n")
                         f.flush()
                 except Exception as e:
-                    logger.warning(f"Failed to finalize bake-and-build.sh log: {e}")
+                    logger.warning("Failed to finalize bake-and-build.sh log: %s", e)
             
             if return_code == 0:
                 logger.info("bake-and-build.sh completed successfully")
             else:
-                logger.error(f"bake-and-build.sh failed with exit code {return_code}")
+                logger.error("bake-and-build.sh failed with exit code %s", return_code)
                 # Print error output for debugging
                 if all_output:
                     print("Last few lines of output:")
                     for line in all_output[-10:]:  # Show last 10 lines
                         print(line)
             
-            # Search for IMG_DROP_FOLDER in the output and clean it up
-            full_output = '\n'.join(all_output)
-            if self._cleanup_img_drop_folder(full_output):
-                logger.info("🧹 Cleaned up IMG_DROP_FOLDER")
-            else:
-                logger.info("ℹ️  No IMG_DROP_FOLDER found to clean up")
-            
-            # Search for YAML_DROP_FOLDER in the output and clean it up
-            if self._cleanup_yaml_drop_folder(full_output):
-                logger.info("🧹 Cleaned up YAML_DROP_FOLDER")
-            else:
-                logger.info("ℹ️  No YAML_DROP_FOLDER found to clean up")
+            # Search for IMG_DROP_FOLDER and YAML_DROP_FOLDER in the output and clean them up
+            for name, cleaned in self._cleanup_drop_folders(all_output).items():
+                if cleaned:
+                    logger.info("🧹 Cleaned up %s", name)
+                else:
+                    logger.info("ℹ️  No %s found to clean up", name)
             
-            # Return both return code and captured output
-            return return_code, full_output
+            # Return both return code and captured output text
+            return return_code, text
             
         except Exception as e:
-            logger.error(f"Error executing bake-and-build.sh: {e}")
+            logger.error("Error executing bake-and-build.sh: %s", e)
             
             # Write error to log file
             if self.bake_build_log_file:
@@ -596,88 +810,69 @@ class CreateSingleDocker:
             
             return 1, f"Error occurred during execution: {e}"
         
-    def _cleanup_img_drop_folder(self, output):
+    def _cleanup_drop_folders(self, lines):
         """
-        Search for IMG_DROP_FOLDER in the bake-and-build.sh output and clean up that directory.
+        Search for IMG_DROP_FOLDER and YAML_DROP_FOLDER in the bake-and-build.sh output
+        in a single pass and clean up those directories.
         
         Args:
-            output (str): The stdout output from bake-and-build.sh
+            lines (list): The stdout output lines from bake-and-build.sh
             
         Returns:
-            bool: True if a folder was found and cleaned up, False otherwise
+            dict: Drop folder name -> True if it was found and cleaned up, False otherwise
         """
+        folders = {}
         try:
-            # Search for lines starting with "IMG_DROP_FOLDER:"
-            for line in output.split('\n'):
+            # Only the first line for each drop folder is used; stop once both are found
+            for line in lines:
                 line = line.strip()
-                if line.startswith('IMG_DROP_FOLDER:'):
-                    # Extract the folder path (everything after the colon and spaces)
-                    folder_path = line.split(':', 1)[1].strip()
-                    folder_path = Path(folder_path)
-                    
-                    if folder_path.exists() and folder_path.is_dir():
-                        logger.debug(f"Cleaning up IMG_DROP_FOLDER: {folder_path}")
-                        try:
-                            shutil.rmtree(folder_path)
-                            logger.info(f"Successfully removed IMG_DROP_FOLDER: {folder_path}")
-                            return True
-                        except Exception as e:
-                            logger.warning(f"Failed to remove IMG_DROP_FOLDER {folder_path}: {e}")
-                            return False
-                    else:
-                        logger.warning(f"IMG_DROP_FOLDER does not exist or is not a directory: {folder_path}")
-                        return False
-                    
-                    # Only process the first IMG_DROP_FOLDER found
-                    break
-            else:
-                logger.info("No IMG_DROP_FOLDER found in bake-and-build.sh output")
-                return False
-                
+                if line.startswith(_DROP_FOLDER_PREFIXES):
+                    name, folder_path = line.split(':', 1)
+                    if name not in folders:
+                        # Relative paths are relative to the bake-and-build.sh directory it runs from
+                        folders[name] = self.bake_and_build_script.parent / folder_path.strip()
+                        if len(folders) == len(_DROP_FOLDERS):
+                            break
         except Exception as e:
-            logger.warning(f"Error while cleaning up IMG_DROP_FOLDER: {e}")
-            return False
+            logger.warning("Error while searching for drop folders: %s", e)
+        
+        # The drop folders are independent, so remove them concurrently
+        with ThreadPoolExecutor(max_workers=len(_DROP_FOLDERS)) as executor:
+            results = executor.map(lambda name: self._remove_drop_folder(name, folders.get(name)), _DROP_FOLDERS)
+            return dict(zip(_DROP_FOLDERS, results))
     
-    def _cleanup_yaml_drop_folder(self, output):
+    def _remove_drop_folder(self, name, folder_path):
         """
-        Search for YAML_DROP_FOLDER in the bake-and-build.sh output and clean up that directory.
+        Clean up a drop folder reported by bake-and-build.sh.
         
         Args:
-            output (str): The stdout output from bake-and-build.sh
+            name (str): Drop folder name, e.g. IMG_DROP_FOLDER
+            folder_path (Path): Folder path from the output, or None if it was not reported
             
         Returns:
-            bool: True if a folder was found and cleaned up, False otherwise
+            bool: True if the folder was cleaned up, False otherwise
         """
+        if folder_path is None:
+            logger.info("No %s found in bake-and-build.sh output", name)
+            return False
+        
+        # A single stat answers both "exists" and "is a directory"
         try:
-            # Search for lines starting with "YAML_DROP_FOLDER:"
-            for line in output.split('\n'):
-                line = line.strip()
-                if line.startswith('YAML_DROP_FOLDER:'):
-                    # Extract the folder path (everything after the colon and spaces)
-                    folder_path = line.split(':', 1)[1].strip()
-                    folder_path = Path(folder_path)
-                    
-                    if folder_path.exists() and folder_path.is_dir():
-                        logger.debug(f"Cleaning up YAML_DROP_FOLDER: {folder_path}")
-                        try:
-                            shutil.rmtree(folder_path)
-                            logger.info(f"Successfully removed YAML_DROP_FOLDER: {folder_path}")
-                            return True
-                        except Exception as e:
-                            logger.warning(f"Failed to remove YAML_DROP_FOLDER {folder_path}: {e}")
-                            return False
-                    else:
-                        logger.warning(f"YAML_DROP_FOLDER does not exist or is not a directory: {folder_path}")
-                        return False
-                    
-                    # Only process the first YAML_DROP_FOLDER found
-                    break
-            else:
-                logger.info("No YAML_DROP_FOLDER found in bake-and-build.sh output")
+            is_dir = stat.S_ISDIR(os.stat(folder_path).st_mode)
+        except OSError:
+            is_dir = False
+        
+        if is_dir:
+            logger.debug("Cleaning up %s: %s", name, folder_path)
+            try:
+                _remove_tree(folder_path)
+                logger.info("Successfully removed %s: %s", name, folder_path)
+                return True
+            except Exception as e:
+                logger.warning("Failed to remove %s %s: %s", name, folder_path, e)
                 return False
-                
-        except Exception as e:
-            logger.warning(f"Error while cleaning up YAML_DROP_FOLDER: {e}")
+        else:
+            logger.warning("%s does not exist or is not a directory: %s", name, folder_path)
             return False
     
     def _extract_docker_image_path(self, output):
@@ -691,122 +886,113 @@ class CreateSingleDocker:
         - "Image exported to: /path/to/image.tar"
         
         Args:
-            output (str): The stdout output from bake-and-build.sh
+            output (str): The stdout output text from bake-and-build.sh
             
         Returns:
             str or None: Path to the Docker image file if found, None otherwise
         """
         try:
-            import re
-            
-            # Define pattern to search for Docker image path
-            pattern = r'Saving docker image,.*?to\s+(.+\.tar)'
-            
-            # Search through output lines
-            for line in output.split('\n'):
-                line = line.strip()
+            # One search over the whole output finds the first matching line
+            match = _DOCKER_IMG_RE.search(output)
+            if match:
+                # bake-and-build.sh runs from its own directory, so relative paths are relative to it
+                docker_image_path = os.path.join(self.bake_and_build_script.parent, match.group(1).strip())
                 
-                # Try the pattern
-                match = re.search(pattern, line, re.IGNORECASE)
-                if match:
-                    docker_image_path = match.group(1).strip()
-                    
-                    # Validate that the path looks reasonable
-                    if docker_image_path and docker_image_path.endswith('.tar'):
-                        # Convert to Path object to normalize
-                        path_obj = Path(docker_image_path)
-                        
-                        # Return the path (prefer absolute path if file exists)
-                        if path_obj.exists():
-                            logger.debug(f"Found Docker image path: {docker_image_path}")
-                            return str(path_obj.resolve())
-                        else:
-                            # Return the path even if file doesn't exist yet
-                            logger.debug(f"Found Docker image path: {docker_image_path}")
-                            return docker_image_path
+                # Validate that the path looks reasonable
+                if docker_image_path and docker_image_path.endswith('.tar'):
+                    # Return the path (prefer absolute path if file exists)
+                    if os.path.exists(docker_image_path):
+                        logger.debug("Found Docker image path: %s", docker_image_path)
+                        return os.path.realpath(docker_image_path)
+                    else:
+                        # Return the path even if file doesn't exist yet
+                        logger.debug("Found Docker image path: %s", docker_image_path)
+                        return docker_image_path
             
             logger.debug("No Docker image path found in bake-and-build.sh output")
             return None
             
         except Exception as e:
-            logger.warning(f"Error while extracting Docker image path: {e}")
+            logger.warning("Error while extracting Docker image path: %s", e)
             return None
         
     def _setup_logging_directory(self):
         """Setup logging directory with timestamp and version information"""
         try:
-            # Create timestamp for directory name
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            
             # Get SDK version (will be "unknown" if not available)
             sdk_version = self.sdk_version if self.sdk_version else "unknown"
             
-            # Create directory name: ovxr-docker.out/<timestamp-sdk_version-platform>/
-            dir_name = f"{timestamp}-{sdk_version}-{self.platform}"
+            # Create directory name: ovxr-docker.out/<run_tag-sdk_version-platform>/
+            dir_name = f"{self.run_tag}-{sdk_version}-{self.platform}"
             
             # Create the logging directory in current working directory
             current_dir = Path.cwd()
             self.log_dir = current_dir / "ovxr-docker.out" / dir_name
             self.log_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created logging directory: {self.log_dir}")
+            logger.info("Created logging directory: %s", self.log_dir)
             
             # Setup log file paths
             self.log_file = self.log_dir / "create_single_docker.log"
-            logger.info(f"Log file path: {self.log_file}")
+            logger.info("Log file path: %s", self.log_file)
             self.bake_build_log_file = self.log_dir / "bake-and-build.log"
-            logger.info(f"bake-and-build.sh log file path: {self.bake_build_log_file}")
-            
-            # Set global log file path for the custom handler BEFORE any logger calls
-            global _current_log_file
-            _current_log_file = self.log_file
-            
-            # Log initial run information to the log file (this will also create the file)
-            with open(self.log_file, 'w') as f:
-                f.write(f"=== create_single_docker.py Run Log ===\\n")
-                f.write(f"Timestamp: {datetime.now().isoformat()}\\n")
-                f.write(f"ISO tar: {getattr(self, 'iso_tar_path', 'unknown')}\\n")
-                f.write(f"Image tar: {getattr(self, 'image_tar_path', 'unknown')}\\n")
-                f.write(f"Platform: {self.platform}\\n")
-                f.write(f"SDK Version: {sdk_version}\\n")
-                f.write(f"Docker name: {getattr(self, 'docker_name', 'auto-generated') or 'auto-generated'}\\n")
-                f.write(f"Target: {getattr(self, 'target', 'all')}\\n")
-                f.write(f"\\n=== Execution Log ===\\n")
-            
+            logger.info("bake-and-build.sh log file path: %s", self.bake_build_log_file)
+            
+            # Open the run log once: write the header straight to its stream, then
+            # attach the handler so all later records are appended to it
+            self._file_handler = RunLogFileHandler(self.log_file, mode='w')
+            self._file_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
+            self._file_handler.stream.write(
+                f"=== create_single_docker.py Run Log ===\n"
+                f"Timestamp: {datetime.now().isoformat()}\n"
+                f"ISO tar: {self.iso_tar_path}\n"
+                f"Image tar: {self.image_tar_path}\n"
+                f"Platform: {self.platform}\n"
+                f"SDK Version: {sdk_version}\n"
+                f"Docker name: {self.docker_name or 'auto-generated'}\n"
+                f"Target: {self.target}\n"
+                f"\n=== Execution Log ===\n"
+            )
+            self._file_handler.flush()
+            logger.addHandler(self._file_handler)
+            _file_logger.addHandler(self._file_handler)
                 
         except Exception as e:
-            logger.error(f"Failed to setup logging directory: {e}")
-            logger.error(f"Ensure you have write permissions in the current directory and as well as enough disk space.")
+            logger.error("Failed to setup logging directory: %s", e)
+            logger.error("Ensure you have write permissions in the current directory and as well as enough disk space.")
+            self._close_log_file()
             self.log_dir = None
             self.log_file = None
             self.bake_build_log_file = None
             raise Exception(f"Logging setup failed: {e}")
     
     def _log_to_file(self, message, log_type="INFO"):
-        """Write a message to the log file with timestamp"""
-        if self.log_file:
-            try:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                with open(self.log_file, 'a') as f:
-                    f.write(f"[{timestamp}] {log_type}: {message}\n")
-            except Exception as e:
-                logger.warning(f"Failed to write to log file: {e}")
+        """Write a message to the log file only (not the console)"""
+        if self._file_handler:
+            _file_logger.log(logging.getLevelName(log_type), message)
+    
+    def _close_log_file(self):
+        """Detach and close the run log file handler"""
+        if self._file_handler:
+            logger.removeHandler(self._file_handler)
+            _file_logger.removeHandler(self._file_handler)
+            self._file_handler.close()
+            self._file_handler = None
     
     def _cleanup_temp_directory(self):
         """Clean up temporary directory if cleanup is enabled"""
         if self.cleanup and self.temp_dir and self.temp_dir.exists():
-            logger.info(f"Cleaning up temp iso directory: {self.temp_dir}")
-            self._log_to_file(f"Cleaning up temp iso directory: {self.temp_dir}")
-            shutil.rmtree(self.temp_dir)
+            logger.info("Cleaning up temp iso directory: %s", self.temp_dir)
+            _remove_tree(self.temp_dir)
             
     def run(self, args=None):
         """Execute the main workflow"""
         try:
             # Script intro message
-            logger.info("="*80)
+            logger.info(_BANNER)
             logger.info("🐳 OVXR Docker Image Creator - Starting Workflow")
             logger.info("Using an ISO & Prebaked Platform's Tar file (provided in OVXR's EFT releases), this will create a single Docker image suitable for use in: ")
-            logger.info(f"{', '.join(SUPPORTED_ENVIRONMENTS)}   ")
-            logger.info("="*80)
+            logger.info("%s   ", ', '.join(SUPPORTED_ENVIRONMENTS))
+            logger.info(_BANNER)
             
             logger.info("Starting create_single_docker workflow")
             
@@ -820,19 +1006,22 @@ class CreateSingleDocker:
             # only sees the ISO when USER_ISO_DIR is mounted as /nobackup/bake
             iso_subdir = self.temp_dir / "iso"
             iso_subdir.mkdir(mode=0o755)
-            logger.debug("Extracting ISO tar file...")
-            iso_extracted_files = self._extract_tar_file(self.iso_tar_path, iso_subdir)
             
-            # Extract image tar to the main temp directory
-            logger.debug("Extracting image tar file...")
-            image_extracted_files = self._extract_tar_file(self.image_tar_path, self.temp_dir)
+            # Extract ISO tar and image tar (to the main temp directory) concurrently,
+            # the two are independent and extraction is I/O bound
+            logger.debug("Extracting ISO and image tar files...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                iso_future = executor.submit(self._extract_tar_file, self.iso_tar_path, iso_subdir)
+                image_future = executor.submit(self._extract_tar_file, self.image_tar_path, self.temp_dir, '.qcow2')
+                iso_future.result()
+                qcow2_file = image_future.result()
             
             # Refine platform detection using extracted files
-            self._refine_platform_from_extracted_files(image_extracted_files)
+            self._refine_platform_from_extracted_files(qcow2_file)
             
             # Find the ISO file
-            self.iso_path = self._find_iso_file(iso_extracted_files)
-            logger.info(f"Found ISO file: {self.iso_path}")
+            self.iso_path = self._find_iso_file(iso_subdir)
+            logger.info("Found ISO file: %s", self.iso_path)
             
             # Extract SDK version from ISO file
             self.sdk_version = self._extract_sdk_version_from_iso(self.iso_path)
@@ -844,91 +1033,86 @@ class CreateSingleDocker:
             
             # Build and execute bake-and-build command
             cmd = self._build_bake_and_build_command()
-            logger.info(f"Executing command:\n {' '.join(cmd)}")
+            cmd_str = ' '.join(cmd)
+            logger.info("Executing command:\n %s", cmd_str)
             
-            # Change to the script directory to ensure proper execution context
-            original_cwd = os.getcwd()
-            os.chdir(self.bake_and_build_script.parent)
+            # Execute bake-and-build.sh
+            logger.info("Executing bake-and-build.sh - open a new shell and run the following command to see real-time output:")
+            logger.info("tail -f %s", self.bake_build_log_file)
+            return_code, bake_build_output = self._run_bake_and_build(cmd, cmd_str)
             
-            try:
-                # Execute bake-and-build.sh
-                logger.info(f"Executing bake-and-build.sh - open a new shell and run the following command to see real-time output:")
-                logger.info(f"tail -f {self.bake_build_log_file}")
-                return_code, bake_build_output = self._run_bake_and_build(cmd)
-                
-                # Log the execution results
-                self._log_to_file(f"Command executed: {' '.join(cmd)}")
-                self._log_to_file(f"Exit code: {return_code}")
-                
-                # Note: bake-and-build.sh output is now written to log file in real-time
-                logger.info(f"bake-and-build.sh output was written in real-time to: {self.bake_build_log_file}")
-                self._log_to_file(f"bake-and-build.sh output written in real-time to: {self.bake_build_log_file}")
-                
-                # Extract Docker image path from output
-                docker_image_path = None
-                if return_code == 0:
-                    docker_image_path = self._extract_docker_image_path(bake_build_output)
-                    if docker_image_path:
-                        logger.info(f"🐳 Docker image saved to: {docker_image_path}")
-                        self._log_to_file(f"Docker image path: {docker_image_path}")
-                
-                # If docker_image_path exists but file does not exist, then this counts as a failure
+            # Log the execution results
+            self._log_to_file(f"Command executed: {cmd_str}")
+            self._log_to_file(f"Exit code: {return_code}")
+            
+            # Note: bake-and-build.sh output is now written to log file in real-time
+            logger.info("bake-and-build.sh output was written in real-time to: %s", self.bake_build_log_file)
+            self._log_to_file(f"bake-and-build.sh output written in real-time to: {self.bake_build_log_file}")
+            
+            # Extract Docker image path from output
+            docker_image_path = None
+            if return_code == 0:
+                docker_image_path = self._extract_docker_image_path(bake_build_output)
                 if docker_image_path:
-                    docker_image_file = Path(docker_image_path)
-                    if not docker_image_file.exists():
-                        logger.error(f"Docker image file not found at expected path: {docker_image_path}")
-                        return_code = 1
+                    logger.info("🐳 Docker image saved to: %s", docker_image_path)
+                    self._log_to_file(f"Docker image path: {docker_image_path}")
+            
+            # If docker_image_path exists but file does not exist, then this counts as a failure
+            if docker_image_path:
+                try:
+                    os.stat(docker_image_path)
+                except FileNotFoundError:
+                    logger.error("Docker image file not found at expected path: %s", docker_image_path)
+                    return_code = 1
 
-                # Success completion message
-                if return_code == 0:
-                    logger.info("="*80)
-                    logger.info("✅ OVXR Docker Image Creator - Workflow Completed Successfully!")
-                    logger.info(f"📂 Logs saved to: {self.log_dir}")
-                    if docker_image_path:
-                        logger.info(f"🐳 Docker image created: {docker_image_path}")
-                        logger.info("▶️ Run to load the image: docker load < " + docker_image_path)
-                    else:
-                        logger.info("🐳 Docker image creation finished. Check bake-and-build.sh output for image details.")
-                    logger.info("="*80)
+            # Success completion message
+            if return_code == 0:
+                logger.info(_BANNER)
+                logger.info("✅ OVXR Docker Image Creator - Workflow Completed Successfully!")
+                logger.info("📂 Logs saved to: %s", self.log_dir)
+                if docker_image_path:
+                    logger.info("🐳 Docker image created: %s", docker_image_path)
+                    logger.info("▶️ Run to load the image: docker load < %s", docker_image_path)
                 else:
-                    logger.info("="*80)
-                    logger.info("❌ OVXR Docker Image Creator - Workflow Completed with Errors")
-                    logger.info(f"📂 Logs saved to: {self.log_dir}")
-                    logger.info(f"🔍 Check logs for error details. Exit code: {return_code}")
-                    logger.info("="*80)
-                
-                return return_code
-                
-            finally:
-                os.chdir(original_cwd)
+                    logger.info("🐳 Docker image creation finished. Check bake-and-build.sh output for image details.")
+                logger.info(_BANNER)
+            else:
+                logger.info(_BANNER)
+                logger.info("❌ OVXR Docker Image Creator - Workflow Completed with Errors")
+                logger.info("📂 Logs saved to: %s", self.log_dir)
+                logger.info("🔍 Check logs for error details. Exit code: %s", return_code)
+                logger.info(_BANNER)
+            
+            return return_code
                 
         except CreateSingleDockerError as e:
-            logger.error(f"Create single docker error: {e}")
-            logger.info("="*80)
+            logger.error("Create single docker error: %s", e)
+            logger.info(_BANNER)
             logger.info("❌ OVXR Docker Image Creator - Workflow Failed")
-            logger.info(f"💥 Error: {e}")
-            if hasattr(self, 'log_dir') and self.log_dir:
-                logger.info(f"📂 Partial logs may be available at: {self.log_dir}")
-            logger.info("="*80)
+            logger.info("💥 Error: %s", e)
+            if self.log_dir:
+                logger.info("📂 Partial logs may be available at: %s", self.log_dir)
+            logger.info(_BANNER)
             return 1
             
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            logger.info("="*80)
+            logger.error("Unexpected error: %s", e)
+            logger.info(_BANNER)
             logger.info("❌ OVXR Docker Image Creator - Workflow Failed (Unexpected Error)")
-            logger.info(f"💥 Unexpected error: {e}")
-            if hasattr(self, 'log_dir') and self.log_dir:
-                logger.info(f"📂 Partial logs may be available at: {self.log_dir}")
-            logger.info("="*80)
+            logger.info("💥 Unexpected error: %s", e)
+            if self.log_dir:
+                logger.info("📂 Partial logs may be available at: %s", self.log_dir)
+            logger.info(_BANNER)
             return 1
             
         finally:
-            # Clean up
-            self._cleanup_temp_directory()
-            
-            # Reset global log file path
-            global _current_log_file
-            _current_log_file = None
+            try:
+                # Clean up
+                self._cleanup_temp_directory()
+            finally:
+                # Close the run log file even if cleanup fails, so the handler
+                # does not stay attached to the module loggers
+                self._close_log_file()
 
 def find_iso_tar_from_image_tar(image_tar_path):
     """
@@ -950,68 +1134,87 @@ def find_iso_tar_from_image_tar(image_tar_path):
         # 8000-2512-d-8808-images-eft15.1.tar -> 8000-2512-iso-eft15.1.tar
         
         filename = image_tar_path.name
-        logger.debug(f"Analyzing image tar filename: {filename}")
-        
-        # Pattern matching for different image tar formats
-        patterns = [
-            # Fixed platform pattern: 8000-<version>-f-<platform>-image-<eft>.tar
-            r'^(8000-\d+)-f-\d+(?:-[\w-]+)?-image-(eft[\d\.]+)\.tar$',
-            # Distributed platform pattern: 8000-<version>-d-<platform>-images-<eft>.tar  
-            r'^(8000-\d+)-d-\d+(?:-[\w-]+)?-images-(eft[\d\.]+)\.tar$',
-            # Generic pattern: 8000-<version>-<type>-<platform>-image[s]-<eft>.tar
-            r'^(8000-\d+)-[fd]-\d+(?:-[\w-]+)?-images?-(eft[\d\.]+)\.tar$'
-        ]
+        logger.debug("Analyzing image tar filename: %s", filename)
         
         base_pattern = None
         eft_version = None
         
-        for pattern in patterns:
-            match = re.match(pattern, filename)
-            if match:
-                base_pattern = match.group(1)  # e.g., "8000-2512"
-                eft_version = match.group(2)   # e.g., "eft15.1"
-                logger.debug(f"Matched pattern: base={base_pattern}, eft={eft_version}")
-                break
+        # Pattern matching for the image tar formats
+        match = _IMAGE_TAR_RE.match(filename)
+        if match:
+            base_pattern = match.group(1)  # e.g., "8000-2512"
+            eft_version = match.group(2)   # e.g., "eft15.1"
+            logger.debug("Matched pattern: base=%s, eft=%s", base_pattern, eft_version)
         
         if not base_pattern or not eft_version:
-            logger.warning(f"Could not parse image tar filename pattern: {filename}")
+            logger.warning("Could not parse image tar filename pattern: %s", filename)
             return None
             
         # Construct the expected ISO tar filename
         expected_iso_name = f"{base_pattern}-iso-{eft_version}.tar"
         expected_iso_path = parent_dir / expected_iso_name
         
-        logger.info(f"Looking for ISO tar file: {expected_iso_name}")
+        logger.info("Looking for ISO tar file: %s", expected_iso_name)
         
         if expected_iso_path.exists():
-            logger.info(f"✅ Found ISO tar file: {expected_iso_path}")
+            logger.info("✅ Found ISO tar file: %s", expected_iso_path)
             return expected_iso_path
         else:
-            logger.warning(f"❌ ISO tar file not found: {expected_iso_path}")
-            
-            # Try to find any ISO tar file in the same directory as a fallback
-            iso_files = list(parent_dir.glob("*-iso-*.tar"))
-            if iso_files:
-                logger.info(f"Found alternative ISO tar files in directory: {[f.name for f in iso_files]}")
-                # Use the first one that matches the base pattern
-                for iso_file in iso_files:
-                    if iso_file.name.startswith(base_pattern):
-                        logger.info(f"✅ Using alternative ISO tar file: {iso_file}")
-                        return iso_file
+            logger.warning("❌ ISO tar file not found: %s", expected_iso_path)
+            
+            # Try to find any ISO tar file in the same directory as a fallback.
+            # One scandir pass matching names directly (like glob("*-iso-*.tar"), dotfiles included),
+            # returning the first one that matches the base pattern
+            iso_names = []
+            with os.scandir(parent_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if '-iso-' in name and name.endswith('.tar'):
+                        if name.startswith(base_pattern):
+                            iso_file = Path(entry.path)
+                            logger.info("✅ Using alternative ISO tar file: %s", iso_file)
+                            return iso_file
+                        iso_names.append(name)
+            
+            if iso_names:
+                logger.info("Found alternative ISO tar files in directory: %s", iso_names)
                 
                 # If no exact match, suggest the first available
-                logger.warning(f"No exact match found. Available ISO files: {[f.name for f in iso_files]}")
+                logger.warning("No exact match found. Available ISO files: %s", iso_names)
                 return None
             else:
-                logger.warning(f"No ISO tar files found in directory: {parent_dir}")
+                logger.warning("No ISO tar files found in directory: %s", parent_dir)
                 return None
                 
     except Exception as e:
-        logger.warning(f"Error while searching for ISO tar file: {e}")
+        logger.warning("Error while searching for ISO tar file: %s", e)
         return None
 
-def main():
-    """Main entry point"""
+# Help logged by main() when easy mode cannot find the ISO tar (%s: script path, image tar path)
+_EASY_MODE_FAILED_HELP = """❌ EASY MODE FAILED: Could not find corresponding ISO tar file
+
+💡 SOLUTION OPTIONS:
+1. Make sure the ISO tar file is in the same directory as the image tar file
+2. Use POWER USER MODE instead:
+   python3 %s --iso-tar <iso_file.tar> --image-tar %s
+"""
+
+# Usage help logged by main() when neither mode's arguments were given (%s: script path)
+_INSUFFICIENT_ARGS_HELP = """❌ ERROR: Insufficient arguments provided
+
+Choose one of these modes:
+
+🎯 EASY MODE (recommended):
+   python3 %s <path_to_image_tar_file>
+   Example: python3 create_single_docker.py /path/to/8000-2512-f-8101-image-eft15.1.tar
+
+🔧 POWER USER MODE:
+   python3 %s --iso-tar <iso_file> --image-tar <image_file>
+   Example: python3 create_single_docker.py --iso-tar iso.tar --image-tar image.tar
+"""
+
+def _build_parser():
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(
         description="Create a single Docker image from ISO and prebaked image tar files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1081,13 +1284,32 @@ Examples:
         help="Custom temporary directory path (if not specified, uses system temp)"
     )
     
+    parser.add_argument(
+        "--use-shm",
+        action="store_true",
+        help="Extract into /dev/shm (RAM) when it has room; ignored with --no-cleanup or --temp-dir"
+    )
+    
+    parser.add_argument(
+        "--run-tag",
+        help="Tag used to name the logging directory under ovxr-docker.out/ (default: current time, YYYYmmdd_HHMMSS)"
+    )
+    
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
         help="Enable verbose logging"
     )
     
-    args = parser.parse_args()
+    return parser
+
+# Built once at import; also lets callers inspect the CLI without running main()
+_PARSER = _build_parser()
+
+def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
+    prog = sys.argv[0]
     
     # Set logging level
     if args.verbose:
@@ -1100,29 +1322,27 @@ Examples:
     # Easy mode: positional argument provided
     if args.image_tar:
         logger.info("🎯 Running in EASY MODE - image tar provided as positional argument")
-        image_tar_path = args.image_tar
+        image_tar_path = Path(args.image_tar)
         
         # Try to auto-discover the ISO tar file
         logger.info("🔍 Auto-discovering ISO tar file...")
         iso_tar_path = find_iso_tar_from_image_tar(image_tar_path)
         
         if not iso_tar_path:
-            logger.error("❌ EASY MODE FAILED: Could not find corresponding ISO tar file")
-            logger.error("")
-            logger.error("💡 SOLUTION OPTIONS:")
-            logger.error("1. Make sure the ISO tar file is in the same directory as the image tar file")
-            logger.error("2. Use POWER USER MODE instead:")
-            logger.error(f"   python3 {sys.argv[0]} --iso-tar <iso_file.tar> --image-tar {image_tar_path}")
-            logger.error("")
+            logger.error(_EASY_MODE_FAILED_HELP, prog, image_tar_path)
             
             # List available ISO files in the directory for user reference
             try:
-                image_dir = Path(image_tar_path).parent
-                iso_files = list(image_dir.glob("*-iso-*.tar"))
-                if iso_files:
-                    logger.error("📁 Available ISO tar files in the same directory:")
-                    for iso_file in iso_files:
-                        logger.error(f"   - {iso_file.name}")
+                image_dir = image_tar_path.parent
+                # scandir gives the dirent type for free, so only symlinks need a stat
+                with os.scandir(image_dir) as entries:
+                    iso_names = [
+                        entry.name for entry in entries
+                        if '-iso-' in entry.name and entry.name.endswith('.tar') and entry.is_file()
+                    ]
+                if iso_names:
+                    logger.error("📁 Available ISO tar files in the same directory:%s",
+                                 ''.join(f"\n   - {iso_name}" for iso_name in iso_names))
                 else:
                     logger.error("📁 No ISO tar files found in the same directory")
             except Exception:
@@ -1142,18 +1362,7 @@ Examples:
         
     # Error: insufficient arguments
     else:
-        logger.error("❌ ERROR: Insufficient arguments provided")
-        logger.error("")
-        logger.error("Choose one of these modes:")
-        logger.error("")
-        logger.error("🎯 EASY MODE (recommended):")
-        logger.error(f"   python3 {sys.argv[0]} <path_to_image_tar_file>")
-        logger.error("   Example: python3 create_single_docker.py /path/to/8000-2512-f-8101-image-eft15.1.tar")
-        logger.error("")
-        logger.error("🔧 POWER USER MODE:")
-        logger.error(f"   python3 {sys.argv[0]} --iso-tar <iso_file> --image-tar <image_file>")
-        logger.error("   Example: python3 create_single_docker.py --iso-tar iso.tar --image-tar image.tar")
-        logger.error("")
+        logger.error(_INSUFFICIENT_ARGS_HELP, prog, prog)
         sys.exit(1)
     
     # Create and run the workflow
@@ -1165,14 +1374,16 @@ Examples:
             docker_name=args.docker_name,
             target=args.target,
             cleanup=not args.no_cleanup,
-            temp_dir=args.temp_dir
+            temp_dir=args.temp_dir,
+            run_tag=args.run_tag,
+            use_shm=args.use_shm
         )
         
         exit_code = creator.run(args)
         sys.exit(exit_code)
         
     except Exception as e:
-        logger.error(f"Failed to create CreateSingleDocker instance: {e}")
+        logger.error("Failed to create CreateSingleDocker instance: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":